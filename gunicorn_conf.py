@@ -0,0 +1,18 @@
+# Gunicorn settings for serving project.server:app in production.
+# Run with: gunicorn -c gunicorn_conf.py project.server:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# One async worker per CPU is enough to keep every core busy. Each worker also starts its own Prisma query
+# engine and opens up to connection_limit database connections. cpu_count() reports the host's CPUs, not the
+# container's limit, so set WEB_CONCURRENCY on small or memory-limited instances.
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# UvicornWorker picks up uvloop and the httptools parser when they are installed.
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Per-request access logging costs measurable throughput; errors are still logged.
+accesslog = None
+loglevel = "warning"
@@ -1,8 +1,8 @@
+from datetime import datetime
 from typing import Optional
 
 import prisma
 import prisma.models
-from dateutil.parser import parse
 from pydantic import BaseModel
 
 
@@ -15,6 +15,27 @@ class AddIntegrationResponse(BaseModel):
     success: bool
     message: str
 
+    class Config:
+        frozen = True
+
+
+def parse_expiry_date(expiryDate: str) -> datetime:
+    """
+    Parses an ISO-8601 expiry date, falling back to dateutil for forms datetime.fromisoformat rejects.
+
+    Args:
+    expiryDate (str): The expiry date as sent by the external service.
+
+    Returns:
+    datetime: The parsed expiry date.
+    """
+    try:
+        return datetime.fromisoformat(expiryDate)
+    except ValueError:
+        from dateutil.parser import isoparse
+
+        return isoparse(expiryDate)
+
 
 async def add_integration(
     userId: str,
@@ -37,7 +58,7 @@ async def add_integration(
     AddIntegrationResponse: Response model for adding new external service integration. Indicates success and contains the ID of the newly created integration.
     """
     try:
-        expiry_datetime = parse(expiryDate) if expiryDate else None
+        expiry_datetime = parse_expiry_date(expiryDate) if expiryDate else None
         new_integration = await prisma.models.Integration.prisma().create(
             data={
                 "userId": userId,
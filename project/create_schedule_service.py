@@ -3,6 +3,8 @@ from typing import Optional
 
 import prisma
 import prisma.models
+import project.get_availability_service
+import project.get_user_profile_service
 from pydantic import BaseModel
 
 
@@ -15,6 +17,9 @@ class CreateScheduleOutput(BaseModel):
     status: str
     message: str
 
+    class Config:
+        frozen = True
+
 
 async def create_schedule(
     userId: str,
@@ -48,6 +53,8 @@ async def create_schedule(
             "available": available,
         }
     )
+    project.get_availability_service.get_availability.cache_invalidate(userId)
+    project.get_user_profile_service.get_user_profile.cache_invalidate(userId)
     return CreateScheduleOutput(
         id=schedule.id,
         status="Success",
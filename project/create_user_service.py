@@ -0,0 +1,64 @@
+import asyncio
+
+import bcrypt
+import prisma
+import prisma.enums
+import prisma.models
+from pydantic import BaseModel
+
+
+class CreateUserProfileResponse(BaseModel):
+    """
+    Response model for a newly created user profile, confirming the stored account details.
+    """
+
+    id: str
+    email: str
+    firstName: str
+    lastName: str
+    role: prisma.enums.Role
+    message: str
+
+
+async def create_user(
+    email: str,
+    password: str,
+    firstName: str,
+    lastName: str,
+    role: prisma.enums.Role,
+) -> CreateUserProfileResponse:
+    """
+    Creates a new user profile.
+
+    The password is hashed with bcrypt in a worker thread so the event loop is not blocked, and the user
+    and their profile are created together in a single nested write.
+
+    Args:
+        email (str): The email address of the new user. Must be unique.
+        password (str): The plain-text password of the new user, which is stored only as a bcrypt hash.
+        firstName (str): The first name of the new user.
+        lastName (str): The last name of the new user.
+        role (prisma.enums.Role): The role of the new user (Professional, Administrator, ITSupport).
+
+    Returns:
+        CreateUserProfileResponse: Response model for a newly created user profile, confirming the stored account details.
+    """
+    hashed_password = await asyncio.to_thread(
+        bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt()
+    )
+    user = await prisma.models.User.prisma().create(
+        data={
+            "email": email,
+            "password": hashed_password.decode("utf-8"),
+            "role": role,
+            "Profile": {"create": {"firstName": firstName, "lastName": lastName}},
+        }
+    )
+    return CreateUserProfileResponse(
+        id=user.id,
+        email=user.email,
+        firstName=firstName,
+        lastName=lastName,
+        role=user.role,
+        message="User profile successfully created.",
+    )
@@ -1,5 +1,8 @@
 import prisma
 import prisma.models
+import project.get_availability_service
+import project.get_schedule_service
+import project.get_user_profile_service
 from pydantic import BaseModel
 
 
@@ -11,6 +14,9 @@ class DeleteScheduleResponse(BaseModel):
     success: bool
     message: str
 
+    class Config:
+        frozen = True
+
 
 async def delete_schedule(id: str) -> DeleteScheduleResponse:
     """
@@ -23,11 +29,15 @@ async def delete_schedule(id: str) -> DeleteScheduleResponse:
         DeleteScheduleResponse: Provides feedback on the operation's outcome, including confirmation of the deletion or an error message.
     """
     try:
-        found_schedule = await prisma.models.Schedule.prisma().find_unique(
-            where={"id": id}
-        )
-        if found_schedule:
-            await prisma.models.Schedule.prisma().delete(where={"id": id})
+        deleted = await prisma.models.Schedule.prisma().delete(where={"id": id})
+        if deleted:
+            project.get_schedule_service.get_schedule.cache_invalidate(id)
+            project.get_availability_service.get_availability.cache_invalidate(
+                deleted.userId
+            )
+            project.get_user_profile_service.get_user_profile.cache_invalidate(
+                deleted.userId
+            )
             return DeleteScheduleResponse(
                 success=True, message="Schedule deleted successfully"
             )
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date
 from typing import List, Optional
 
 import prisma
@@ -17,6 +17,12 @@ class GenerateReportResponse(BaseModel):
     message: str
     reportUrl: Optional[str] = None
 
+    class Config:
+        frozen = True
+
+
+REPORT_TYPES = dict(prisma.enums.ReportType.__members__)
+
 
 async def generate_report(
     userId: str, startDate: str, endDate: str, dataPoints: List[str], reportType: str
@@ -35,16 +41,17 @@ async def generate_report(
     GenerateReportResponse: Response model encapsulating the details of the generated report, including a success indicator, report ID, and possibly a URL to download the report.
     """
     try:
-        start_date_object = datetime.strptime(startDate, "%Y-%m-%d")
-        end_date_object = datetime.strptime(endDate, "%Y-%m-%d")
-    except ValueError as e:
+        date.fromisoformat(startDate)
+        date.fromisoformat(endDate)
+    except ValueError:
         return GenerateReportResponse(
             success=False,
             reportId="",
             message="Invalid date format. Please use YYYY-MM-DD.",
             reportUrl=None,
         )
-    if reportType not in prisma.enums.ReportType.__members__:
+    report_type = REPORT_TYPES.get(reportType)
+    if report_type is None:
         return GenerateReportResponse(
             success=False,
             reportId="",
@@ -57,7 +64,7 @@ async def generate_report(
             data={
                 "userId": userId,
                 "content": report_content,
-                "reportType": getattr(prisma.enums.ReportType, reportType),
+                "reportType": report_type,
             }
         )
         report_url = f"http://example.com/reports/{new_report.id}"
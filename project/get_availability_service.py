@@ -1,8 +1,10 @@
+import asyncio
 from datetime import datetime, timezone
 from typing import Optional
 
 import prisma
 import prisma.models
+from async_lru import alru_cache
 from pydantic import BaseModel
 
 
@@ -16,11 +18,17 @@ class GetAvailabilityResponse(BaseModel):
     message: Optional[str] = None
     timeUntilNextAvailability: Optional[int] = None
 
+    class Config:
+        frozen = True
 
+
+@alru_cache(maxsize=10_000, ttl=2)
 async def get_availability(userId: str) -> GetAvailabilityResponse:
     """
     Retrieves the current availability status of a professional.
 
+    Results are cached per professional for two seconds; schedule and availability writes invalidate the entry.
+
     Args:
         userId (str): The unique identifier of the professional whose availability status is being requested.
 
@@ -28,36 +36,41 @@ async def get_availability(userId: str) -> GetAvailabilityResponse:
         GetAvailabilityResponse: The output model that provides the current availability status of the requested professional. It encapsulates whether the professional is currently available and any relevant message or detail that might explain their availability state.
     """
     now = datetime.now(timezone.utc)
-    current_schedule = await prisma.models.Schedule.prisma().find_first(
-        where={"userId": userId, "startTime": {"lte": now}, "endTime": {"gte": now}},
-        include={"Appointment": True},
+    current_schedule, next_available_schedule = await asyncio.gather(
+        prisma.models.Schedule.prisma().find_first(
+            where={
+                "userId": userId,
+                "startTime": {"lte": now},
+                "endTime": {"gte": now},
+            },
+            include={"Appointment": True},
+        ),
+        prisma.models.Schedule.prisma().find_first(
+            where={"userId": userId, "startTime": {"gt": now}, "available": True},
+            order={"startTime": "asc"},
+        ),
     )
     if current_schedule:
         if current_schedule.available and (not current_schedule.Appointment):
             return GetAvailabilityResponse(
                 userId=userId, isAvailable=True, message="Available"
             )
+        elif next_available_schedule:
+            next_start = next_available_schedule.startTime
+            time_until_next = next_start - now
+            return GetAvailabilityResponse(
+                userId=userId,
+                isAvailable=False,
+                message=f"Unavailable until {next_start.year:04d}-{next_start.month:02d}-{next_start.day:02d} {next_start.hour:02d}:{next_start.minute:02d}",
+                timeUntilNextAvailability=time_until_next.days * 1440
+                + time_until_next.seconds // 60,
+            )
         else:
-            next_available_schedule = await prisma.models.Schedule.prisma().find_first(
-                where={"userId": userId, "startTime": {"gt": now}, "available": True},
-                order={"startTime": "asc"},
+            return GetAvailabilityResponse(
+                userId=userId,
+                isAvailable=False,
+                message="No more available schedules today",
             )
-            if next_available_schedule:
-                time_until_next = (
-                    next_available_schedule.startTime - now
-                ).total_seconds()
-                return GetAvailabilityResponse(
-                    userId=userId,
-                    isAvailable=False,
-                    message=f"Unavailable until {next_available_schedule.startTime.strftime('%Y-%m-%d %H:%M')}",
-                    timeUntilNextAvailability=int(time_until_next / 60),
-                )
-            else:
-                return GetAvailabilityResponse(
-                    userId=userId,
-                    isAvailable=False,
-                    message="No more available schedules today",
-                )
     else:
         return GetAvailabilityResponse(
             userId=userId, isAvailable=False, message="No current schedules found"
@@ -18,6 +18,9 @@ class ReportDetails(BaseModel):
     createdAt: datetime
     updatedAt: Optional[datetime] = None
 
+    class Config:
+        frozen = True
+
 
 async def get_report(id: str) -> ReportDetails:
     """
@@ -1,10 +1,10 @@
 from datetime import datetime
-from enum import Enum
 from typing import List, Optional
 
 import prisma
 import prisma.enums
 import prisma.models
+from async_lru import alru_cache
 from pydantic import BaseModel
 
 
@@ -17,6 +17,9 @@ class UserBrief(BaseModel):
     email: str
     role: prisma.enums.Role
 
+    class Config:
+        frozen = True
+
 
 class AppointmentBrief(BaseModel):
     """
@@ -29,6 +32,9 @@ class AppointmentBrief(BaseModel):
     endTime: datetime
     description: Optional[str] = None
 
+    class Config:
+        frozen = True
+
 
 class GetScheduleResponse(BaseModel):
     """
@@ -44,17 +50,21 @@ class GetScheduleResponse(BaseModel):
     user: UserBrief
     appointments: List[AppointmentBrief]
 
-
-class Role(Enum):
-    Professional: str = "Professional"
-    Administrator: str = "Administrator"
-    ITSupport: str = "ITSupport"
+    class Config:
+        frozen = True
 
 
+@alru_cache(maxsize=10_000, ttl=2)
 async def get_schedule(id: str) -> GetScheduleResponse:
     """
     Retrieves the details of a specific schedule or appointment.
 
+    Results are cached per schedule for two seconds; updating or deleting the schedule invalidates the entry.
+    Other changes can take up to the TTL to show here:
+    - update_availability rewrites the available flag of many schedules at once without invalidating them.
+    - update_user does not invalidate the owner's schedules, so the cached user email and role can be stale.
+    - Invalidation only reaches the worker that handled the write; other workers keep their entries.
+
     Args:
         id (str): This is the unique identifier for each schedule, used to retrieve the specific schedule's details.
 
@@ -66,11 +76,11 @@ async def get_schedule(id: str) -> GetScheduleResponse:
     )
     if schedule is None:
         raise ValueError(f"Schedule with ID {id} not found")
-    user_brief = UserBrief(
-        userId=schedule.User.id, email=schedule.User.email, role=schedule.User.role.name
+    user_brief = UserBrief.construct(
+        userId=schedule.User.id, email=schedule.User.email, role=schedule.User.role
     )
     appointments_brief = [
-        AppointmentBrief(
+        AppointmentBrief.construct(
             appointmentId=appointment.id,
             title=appointment.title,
             startTime=appointment.startTime,
@@ -79,7 +89,7 @@ async def get_schedule(id: str) -> GetScheduleResponse:
         )
         for appointment in schedule.Appointment
     ]
-    return GetScheduleResponse(
+    return GetScheduleResponse.construct(
         schedule_id=schedule.id,
         startTime=schedule.startTime,
         endTime=schedule.endTime,
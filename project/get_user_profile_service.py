@@ -1,9 +1,9 @@
-from enum import Enum
 from typing import List
 
 import prisma
 import prisma.enums
 import prisma.models
+from async_lru import alru_cache
 from pydantic import BaseModel
 
 
@@ -16,6 +16,9 @@ class NotificationPreferences(BaseModel):
     sms_notifications_enabled: bool
     app_notifications_enabled: bool
 
+    class Config:
+        frozen = True
+
 
 class UserProfileResponse(BaseModel):
     """
@@ -30,17 +33,17 @@ class UserProfileResponse(BaseModel):
     linked_schedules: List[str]
     notification_preferences: NotificationPreferences
 
-
-class Role(Enum):
-    Professional: str = "Professional"
-    Administrator: str = "Administrator"
-    ITSupport: str = "ITSupport"
+    class Config:
+        frozen = True
 
 
+@alru_cache(maxsize=10_000, ttl=2)
 async def get_user_profile(id: str) -> UserProfileResponse:
     """
     Retrieves a user's profile information from the database.
 
+    Results are cached per user for two seconds; profile, preference and schedule writes invalidate the entry.
+
     Args:
         id (str): Unique identifier for the user whose profile is being requested.
 
@@ -49,22 +52,17 @@ async def get_user_profile(id: str) -> UserProfileResponse:
     """
     user = await prisma.models.User.prisma().find_unique(
         where={"id": id},
-        include={"Profile": True, "Schedules": True, "Notification": True},
+        include={"Profile": True, "Schedules": True},
     )
     if not user:
         raise ValueError("User not found.")
-    notification_preferences = NotificationPreferences(
-        email_notifications_enabled=any(
-            (n.message.startswith("Email:") for n in user.Notification)
-        ),
-        sms_notifications_enabled=any(
-            (n.message.startswith("SMS:") for n in user.Notification)
-        ),
-        app_notifications_enabled=any(
-            (n.message.startswith("App:") for n in user.Notification)
-        ),
+    profile = user.Profile
+    notification_preferences = NotificationPreferences.construct(
+        email_notifications_enabled=profile.emailEnabled if profile else False,
+        sms_notifications_enabled=profile.smsEnabled if profile else False,
+        app_notifications_enabled=profile.appEnabled if profile else False,
     )
-    return UserProfileResponse(
+    return UserProfileResponse.construct(
         user_id=user.id,
         email=user.email,
         role=prisma.enums.Role[user.role],
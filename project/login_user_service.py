@@ -1,10 +1,13 @@
-from datetime import datetime, timedelta
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import bcrypt
 import prisma
 import prisma.models
 from jose import jwt
+from project.jwt_config import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY
 from pydantic import BaseModel
 
 
@@ -16,12 +19,11 @@ class UserLoginResponse(BaseModel):
     token: str
     expires_in: int
 
+    class Config:
+        frozen = True
 
-SECRET_KEY = "your_secret_key_here"
 
-ALGORITHM = "HS256"
-
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+PASSWORD_CHECK_SEMAPHORE = asyncio.Semaphore(os.cpu_count() or 1)
 
 
 async def create_access_token(
@@ -38,12 +40,15 @@ async def create_access_token(
         str: A JWT token string.
     """
     to_encode = data.copy()
+    now = datetime.now(timezone.utc)
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+        expire = now + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = await asyncio.to_thread(
+        jwt.encode, to_encode, SECRET_KEY, algorithm=ALGORITHM
+    )
     return encoded_jwt
 
 
@@ -61,7 +66,11 @@ async def login_user(email: str, password: str) -> UserLoginResponse:
     user = await prisma.models.User.prisma().find_unique(where={"email": email})
     if user:
         hashed_password = user.password.encode("utf-8")
-        if bcrypt.checkpw(password.encode("utf-8"), hashed_password):
+        async with PASSWORD_CHECK_SEMAPHORE:
+            password_matches = await asyncio.to_thread(
+                bcrypt.checkpw, password.encode("utf-8"), hashed_password
+            )
+        if password_matches:
             access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
             access_token = await create_access_token(
                 data={"sub": user.email}, expires_delta=access_token_expires
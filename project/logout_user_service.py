@@ -10,6 +10,9 @@ class LogoutUserResponse(BaseModel):
 
     message: str
 
+    class Config:
+        frozen = True
+
 
 async def logout_user(token: str) -> LogoutUserResponse:
     """
@@ -1,8 +1,15 @@
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
 
 import prisma
 import prisma.models
 from jose import jwt
+from project.jwt_config import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    REFRESH_TOKEN_EXPIRE_DAYS,
+    SECRET_KEY,
+)
 from pydantic import BaseModel
 
 
@@ -16,6 +23,9 @@ class RefreshTokenResponse(BaseModel):
     token_type: str
     expires_in: int
 
+    class Config:
+        frozen = True
+
 
 async def refresh_token(refresh_token: str) -> RefreshTokenResponse:
     """
@@ -23,6 +33,8 @@ async def refresh_token(refresh_token: str) -> RefreshTokenResponse:
 
     The function searches for the refresh token provided in the database, validates it,
     generates a new access token and optionally a new refresh token for the user.
+    The stored token is only rotated if it still matches the one presented, so of two
+    concurrent refreshes with the same token only one succeeds.
 
     Args:
         refresh_token (str): The refresh token issued to the user during the login or previous token refresh operation.
@@ -33,32 +45,32 @@ async def refresh_token(refresh_token: str) -> RefreshTokenResponse:
     Raises:
         ValueError: If the refresh token is not found or is invalid.
     """
-    SECRET_KEY = "your_super_secret_key"
-    ALGORITHM = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES = 15
+    now = datetime.now(timezone.utc)
     auth_token = await prisma.models.AuthToken.prisma().find_unique(
-        where={"token": refresh_token}, include={"User": True}
+        where={"token": refresh_token}
     )
-    if auth_token is None or datetime.utcnow() > auth_token.expiryDate:
+    if auth_token is None or now > auth_token.expiryDate:
         raise ValueError("Refresh token is invalid or has expired.")
-    access_token_expires = datetime.utcnow() + timedelta(
-        minutes=ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-    access_token = jwt.encode(
-        {"sub": auth_token.User.id, "exp": access_token_expires},
+    access_token_expires = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = await asyncio.to_thread(
+        jwt.encode,
+        {"sub": auth_token.userId, "exp": access_token_expires},
         SECRET_KEY,
         algorithm=ALGORITHM,
     )
-    refresh_token_expires = datetime.utcnow() + timedelta(days=30)
-    new_refresh_token = jwt.encode(
-        {"sub": auth_token.User.id, "exp": refresh_token_expires},
+    refresh_token_expires = now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    new_refresh_token = await asyncio.to_thread(
+        jwt.encode,
+        {"sub": auth_token.userId, "exp": refresh_token_expires},
         SECRET_KEY,
         algorithm=ALGORITHM,
     )
-    await prisma.models.AuthToken.prisma().update(
-        where={"id": auth_token.id},
+    rotated_count = await prisma.models.AuthToken.prisma().update_many(
+        where={"id": auth_token.id, "token": refresh_token},
         data={"token": new_refresh_token, "expiryDate": refresh_token_expires},
     )
+    if not rotated_count:
+        raise ValueError("Refresh token is invalid or has expired.")
     return RefreshTokenResponse(
         access_token=access_token,
         refresh_token=new_refresh_token,
@@ -10,6 +10,9 @@ class RemoveIntegrationResponse(BaseModel):
 
     message: str
 
+    class Config:
+        frozen = True
+
 
 async def remove_integration(id: str) -> RemoveIntegrationResponse:
     """
@@ -28,5 +31,9 @@ async def remove_integration(id: str) -> RemoveIntegrationResponse:
         remove_integration('12345-67890')
         > RemoveIntegrationResponse(message='Integration successfully removed.')
     """
-    await prisma.models.Integration.prisma().delete(where={"id": id})
+    deleted_count = await prisma.models.Integration.prisma().delete_many(
+        where={"id": id}
+    )
+    if not deleted_count:
+        return RemoveIntegrationResponse(message="Integration not found.")
     return RemoveIntegrationResponse(message="Integration successfully removed.")
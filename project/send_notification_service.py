@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -12,6 +13,51 @@ class SendNotificationOutput(BaseModel):
     failed_channels: List[str]
     error_message: Optional[str] = None
 
+    class Config:
+        frozen = True
+
+
+async def send_email(recipient_id: str, message: str) -> None:
+    """
+    Sends a notification to the recipient by email.
+    """
+    print(f"Sending email to {recipient_id} with message: {message}")
+
+
+async def send_sms(recipient_id: str, message: str) -> None:
+    """
+    Sends a notification to the recipient by SMS.
+    """
+    print(f"Sending SMS to {recipient_id} with message: {message}")
+
+
+async def send_in_app(recipient_id: str, message: str) -> None:
+    """
+    Sends an in-app notification to the recipient.
+    """
+    print(f"Sending in-app notification to {recipient_id} with message: {message}")
+
+
+CHANNEL_SENDERS = {"email": send_email, "sms": send_sms, "in_app": send_in_app}
+
+
+async def send_via_channel(channel: str, recipient_id: str, message: str) -> None:
+    """
+    Sends a notification through a single channel.
+
+    Args:
+        channel (str): The channel to send through, one of the keys of CHANNEL_SENDERS.
+        recipient_id (str): Unique identifier for the recipient.
+        message (str): The message content of the notification to be sent.
+
+    Raises:
+        ValueError: If the channel is not supported.
+    """
+    sender = CHANNEL_SENDERS.get(channel)
+    if sender is None:
+        raise ValueError(f"Unsupported channel: {channel}")
+    await sender(recipient_id, message)
+
 
 async def send_notification(
     recipient_id: str, message: str, channels: List[str]
@@ -29,22 +75,15 @@ async def send_notification(
     Returns:
         SendNotificationOutput: Model representing the outcome of sending a notification to the specified recipient(s).
     """
+    results = await asyncio.gather(
+        *(send_via_channel(channel, recipient_id, message) for channel in channels),
+        return_exceptions=True,
+    )
     failed_channels = []
-    for channel in channels:
-        try:
-            if channel == "email":
-                print(f"Sending email to {recipient_id} with message: {message}")
-            elif channel == "sms":
-                print(f"Sending SMS to {recipient_id} with message: {message}")
-            elif channel == "in_app":
-                print(
-                    f"Sending in-app notification to {recipient_id} with message: {message}"
-                )
-            else:
-                raise ValueError(f"Unsupported channel: {channel}")
-        except Exception as e:
+    for channel, result in zip(channels, results):
+        if isinstance(result, Exception):
             failed_channels.append(channel)
-            print(f"Failed to send notification via {channel}, Error: {str(e)}")
+            print(f"Failed to send notification via {channel}, Error: {str(result)}")
     if failed_channels:
         return SendNotificationOutput(
             success=False,
@@ -1,8 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 import prisma
 import prisma.models
+import project.get_availability_service
 from pydantic import BaseModel
 
 
@@ -36,12 +37,16 @@ async def update_availability(
         print(response)
         > {'success': True, 'updated_availability': True, 'message': "Professional's availability status updated successfully."}
     """
+    now = datetime.now(timezone.utc)
     try:
         await prisma.models.Schedule.prisma().update_many(
-            where={"userId": professional_id, "endTime": {"gt": datetime.now()}},
+            where={"userId": professional_id, "endTime": {"gt": now}},
             data={"available": new_availability},
         )
-        return UpdateAvailabilityResponse(
+        project.get_availability_service.get_availability.cache_invalidate(
+            professional_id
+        )
+        return UpdateAvailabilityResponse.construct(
             success=True,
             updated_availability=new_availability,
             message="Professional's availability status updated successfully.",
@@ -24,7 +24,7 @@ class IntegrationUpdateResponse(BaseModel):
     """
 
     status: str
-    updatedIntegration: IntegrationDetails
+    updatedIntegration: Optional[IntegrationDetails] = None
 
 
 async def update_integration(
@@ -57,10 +57,21 @@ async def update_integration(
                 "expiryDate": expiryDate,
             },
         )
+        if updated_integration is None:
+            return IntegrationUpdateResponse.construct(
+                status="failed: Integration not found.", updatedIntegration=None
+            )
         return IntegrationUpdateResponse(
-            status="success", updatedIntegration=updated_integration
+            status="success",
+            updatedIntegration=IntegrationDetails(
+                id=updated_integration.id,
+                service=updated_integration.service,
+                accessToken=updated_integration.accessToken,
+                refreshToken=updated_integration.refreshToken,
+                expiryDate=updated_integration.expiryDate,
+            ),
         )
     except Exception as e:
-        return IntegrationUpdateResponse(
+        return IntegrationUpdateResponse.construct(
             status=f"failed: {str(e)}", updatedIntegration=None
         )
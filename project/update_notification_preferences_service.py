@@ -1,5 +1,6 @@
 import prisma
 import prisma.models
+import project.get_user_profile_service
 from pydantic import BaseModel
 
 
@@ -37,20 +38,22 @@ async def update_notification_preferences(
         > UpdateNotificationPreferencesResponse(user_id="123e4567-e89b-12d3-a456-426614174000", status="Success")
     """
     try:
-        user = await prisma.models.User.prisma().find_unique(where={"id": user_id})
-        if not user:
-            return UpdateNotificationPreferencesResponse(
-                user_id=user_id, status="User not found"
-            )
-        await prisma.models.Notification.prisma().update_many(
+        updated_count = await prisma.models.Profile.prisma().update_many(
             where={"userId": user_id},
             data={
-                "email_notifications": email_notifications,
-                "sms_notifications": sms_notifications,
-                "in_app_notifications": in_app_notifications,
+                "emailEnabled": email_notifications,
+                "smsEnabled": sms_notifications,
+                "appEnabled": in_app_notifications,
             },
         )
-        return UpdateNotificationPreferencesResponse(user_id=user_id, status="Success")
+        if not updated_count:
+            return UpdateNotificationPreferencesResponse(
+                user_id=user_id, status="User not found"
+            )
+        project.get_user_profile_service.get_user_profile.cache_invalidate(user_id)
+        return UpdateNotificationPreferencesResponse.construct(
+            user_id=user_id, status="Success"
+        )
     except Exception as e:
         return UpdateNotificationPreferencesResponse(
             user_id=user_id, status=f"Failure: {str(e)}"
@@ -2,6 +2,8 @@ from datetime import datetime
 
 import prisma
 import prisma.models
+import project.get_availability_service
+import project.get_schedule_service
 from pydantic import BaseModel
 
 
@@ -37,10 +39,7 @@ async def update_schedule(
         UpdateScheduleResponse: Confirms that the schedule or appointment has been updated successfully.
     """
     try:
-        schedule = await prisma.models.Schedule.prisma().find_unique(where={"id": id})
-        if not schedule:
-            return UpdateScheduleResponse(success=False, message="Schedule not found.")
-        await prisma.models.Schedule.prisma().update(
+        schedule = await prisma.models.Schedule.prisma().update(
             where={"id": id},
             data={
                 "startTime": startTime,
@@ -50,7 +49,13 @@ async def update_schedule(
                 "available": available,
             },
         )
-        return UpdateScheduleResponse(
+        if not schedule:
+            return UpdateScheduleResponse(success=False, message="Schedule not found.")
+        project.get_schedule_service.get_schedule.cache_invalidate(id)
+        project.get_availability_service.get_availability.cache_invalidate(
+            schedule.userId
+        )
+        return UpdateScheduleResponse.construct(
             success=True, message="Schedule updated successfully."
         )
     except Exception as e:
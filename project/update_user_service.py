@@ -2,6 +2,7 @@ from typing import Optional
 
 import prisma
 import prisma.models
+import project.get_user_profile_service
 from pydantic import BaseModel
 
 
@@ -28,6 +29,9 @@ async def update_user(
     """
     Updates an existing user profile.
 
+    The user and profile changes are sent as a single batch, so they are applied together in one round trip.
+    Batched writes return no rows, so when email or role is left unchanged the stored values are read back afterwards.
+
     Args:
         id (str): The unique identifier for the user whose profile is being updated.
         email (Optional[str]): The updated email address for the user.
@@ -38,33 +42,35 @@ async def update_user(
     Returns:
         UpdateUserProfileResponse: Confirms the updated fields of the user's profile, along with any other pertinent information reflecting the changes.
     """
-    update_payload = {}
-    profile_payload = {}
-    if email is not None:
-        update_payload["email"] = email
-    if role is not None:
-        update_payload["role"] = role
-    if firstName or lastName:
-        profile = await prisma.models.Profile.prisma().find_unique(where={"userId": id})
-        if profile:
-            if firstName is not None:
-                profile_payload["firstName"] = firstName
-            if lastName is not None:
-                profile_payload["lastName"] = lastName
-            await prisma.models.Profile.prisma().update(
-                where={"userId": id}, data=profile_payload
-            )
-    if update_payload:
-        user = await prisma.models.User.prisma().update(
-            where={"id": id}, data=update_payload
-        )
-    else:
+    update_payload = {
+        field: value
+        for field, value in (("email", email), ("role", role))
+        if value is not None
+    }
+    profile_payload = {
+        field: value
+        for field, value in (("firstName", firstName), ("lastName", lastName))
+        if value is not None
+    }
+    if not update_payload and not profile_payload:
+        return UpdateUserProfileResponse.construct(id=id, updateStatus="No changes")
+    async with prisma.get_client().batch_() as batcher:
+        if update_payload:
+            batcher.user.update(where={"id": id}, data=update_payload)
+        if profile_payload:
+            batcher.profile.update(where={"userId": id}, data=profile_payload)
+    project.get_user_profile_service.get_user_profile.cache_invalidate(id)
+    if email is None or role is None:
+        # The batch above raised RecordNotFoundError if the user or profile was missing.
         user = await prisma.models.User.prisma().find_unique(where={"id": id})
-    return UpdateUserProfileResponse(
-        id=user.id,
-        email=user.email,
+        if user is not None:
+            email = user.email
+            role = user.role
+    return UpdateUserProfileResponse.construct(
+        id=id,
+        email=email,
         firstName=firstName,
         lastName=lastName,
-        role=user.role,
+        role=role,
         updateStatus="User profile successfully updated.",
     )